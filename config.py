@@ -1,5 +1,7 @@
-from os import environ, getenv
+from os import getenv
 
 TOKEN = getenv('TOKEN')
-STAFF_ROLE_ID = getenv('STAFF_ROLE_ID')
-AWAIZ_USER_ID = getenv('AWAIZ_USER_ID')
+DATABASE_URL = getenv('DATABASE_URL')
+BOT_ENV = getenv('BOT_ENV', 'development')
+STAFF_ROLE_ID = int(getenv('STAFF_ROLE_ID') or 0)
+AWAIZ_USER_ID = int(getenv('AWAIZ_USER_ID') or 0)
@@ -1,12 +1,17 @@
-from kusogaki_bot.core.base_cog import BaseCog
-from kusogaki_bot.core.bot import KusogakiBot
-from kusogaki_bot.core.db import Database
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from kusogaki_bot.core.exceptions import (
     BotError,
     DatabaseConnectionError,
     DatabaseError,
 )
 
+if TYPE_CHECKING:
+    from kusogaki_bot.core.base_cog import BaseCog
+    from kusogaki_bot.core.bot import KusogakiBot
+    from kusogaki_bot.core.db import Database
+
 __all__ = [
     'KusogakiBot',
     'Database',
@@ -15,3 +20,25 @@ __all__ = [
     'DatabaseError',
     'DatabaseConnectionError',
 ]
+
+_LAZY_IMPORTS = {
+    'KusogakiBot': 'kusogaki_bot.core.bot',
+    'Database': 'kusogaki_bot.core.db',
+    'BaseCog': 'kusogaki_bot.core.base_cog',
+}
+
+
+def __getattr__(name: str):
+    """
+    Import the bot, database and cog classes on first access
+
+    Keeps `from kusogaki_bot.core import DatabaseError` from pulling in
+    discord.py and SQLAlchemy
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -1,11 +1,12 @@
+import asyncio
 import logging
 from pathlib import Path
-from typing import List
+from typing import Tuple
 
+from aiohttp.resolver import DefaultResolver
 from discord import Intents, Message
 from discord.ext import commands
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -14,7 +15,7 @@ class KusogakiBot(commands.AutoShardedBot):
     Discord bot class with improved structure and error handling
     """
 
-    DEFAULT_PREFIX = ['kuso ', 'KUSO ', 'Kuso ']
+    DEFAULT_PREFIX = ('kuso ', 'KUSO ', 'Kuso ')
     FEATURES_DIRECTORY = Path('kusogaki_bot/features')
 
     def __init__(self) -> None:
@@ -27,13 +28,14 @@ class KusogakiBot(commands.AutoShardedBot):
             intents=intents,
             help_command=None,
         )
+        self._prefixes: Tuple[str, ...] = self.DEFAULT_PREFIX
 
-    async def get_prefix(self, message: Message) -> List[str]:
+    async def get_prefix(self, message: Message) -> Tuple[str, ...]:
         """
         Get the command prefix for the bot
         Returns both mention and custom prefixes
         """
-        return commands.when_mentioned_or(*self.DEFAULT_PREFIX)(self, message)
+        return self._prefixes
 
     async def load_cogs(self) -> None:
         """
@@ -44,25 +46,40 @@ class KusogakiBot(commands.AutoShardedBot):
             logger.error(f'Features directory not found: {self.FEATURES_DIRECTORY}')
             return
 
-        for feature_dir in self.FEATURES_DIRECTORY.iterdir():
-            if not feature_dir.is_dir():
-                continue
+        feature_names = [
+            feature_dir.name
+            for feature_dir in self.FEATURES_DIRECTORY.iterdir()
+            if feature_dir.is_dir() and (feature_dir / 'cog.py').exists()
+        ]
 
-            cog_file = feature_dir / 'cog.py'
-            if not cog_file.exists():
-                continue
+        await asyncio.gather(
+            *(self._load_feature(feature_name) for feature_name in feature_names)
+        )
+
+    async def _load_feature(self, feature_name: str) -> None:
+        """
+        Load a single feature's cog extension, logging instead of raising on failure
 
-            try:
-                cog_path = f'kusogaki_bot.features.{feature_dir.name}.cog'
-                await self.load_extension(cog_path)
-                logger.info(f'Loaded feature: {feature_dir.name} ({cog_path})')
-            except Exception as e:
-                logger.error(f'Failed to load feature {feature_dir.name}: {str(e)}')
+        Args:
+            feature_name (str): Name of the feature directory
+        """
+        try:
+            cog_path = f'kusogaki_bot.features.{feature_name}.cog'
+            await self.load_extension(cog_path)
+            logger.info(f'Loaded feature: {feature_name} ({cog_path})')
+        except Exception as e:
+            logger.error(f'Failed to load feature {feature_name}: {str(e)}')
 
     async def setup_hook(self) -> None:
         """
         Setup hook called before the bot starts
         """
+        logger.info(f'Using aiohttp DNS resolver: {DefaultResolver.__name__}')
+        self._prefixes = (
+            f'<@{self.user.id}> ',
+            f'<@!{self.user.id}> ',
+            *self.DEFAULT_PREFIX,
+        )
         await self.load_cogs()
 
     async def on_ready(self) -> None:
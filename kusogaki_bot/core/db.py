@@ -1,16 +1,14 @@
 import logging
-import os
-from functools import lru_cache
-from typing import Optional, Type
+import threading
+from typing import Optional
 
 from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import QueuePool
 
+from config import DATABASE_URL
 from kusogaki_bot.core.exceptions import DatabaseConnectionError
 
-Base = declarative_base()
-
 
 class DatabaseConfig:
     """
@@ -21,6 +19,7 @@ class DatabaseConfig:
     MAX_OVERFLOW = 10
     POOL_TIMEOUT = 30
     POOL_RECYCLE = 1800
+    POOL_PRE_PING = True
 
 
 class Database:
@@ -28,23 +27,28 @@ class Database:
     Singleton class to manage PostgreSQL database connection
     """
 
-    _instance: Optional[Type[Session]] = None
+    _instance: Optional[sessionmaker] = None
+    _lock = threading.Lock()
 
     @classmethod
-    @lru_cache(maxsize=1)
-    def get_instance(cls) -> Session:
+    def get_sessionmaker(cls) -> sessionmaker:
         """
-        Get database connection instance using singleton pattern
+        Get the shared session factory, creating the engine on first use
 
         Returns:
-            Session: SQLAlchemy session instance
+            sessionmaker: SQLAlchemy session factory bound to the engine
 
         Raises:
             DatabaseConnectionError: If connection cannot be established
         """
+        if cls._instance is not None:
+            return cls._instance
 
-        if cls._instance is None:
-            database_url = os.getenv('DATABASE_URL')
+        with cls._lock:
+            if cls._instance is not None:
+                return cls._instance
+
+            database_url = DATABASE_URL
             if not database_url:
                 raise DatabaseConnectionError(
                     'DATABASE_URL environment variable is not set'
@@ -63,10 +67,10 @@ class Database:
                     max_overflow=DatabaseConfig.MAX_OVERFLOW,
                     pool_timeout=DatabaseConfig.POOL_TIMEOUT,
                     pool_recycle=DatabaseConfig.POOL_RECYCLE,
+                    pool_pre_ping=DatabaseConfig.POOL_PRE_PING,
                 )
 
                 cls._instance = sessionmaker(bind=engine)
-                Base.metadata.create_all(engine)
 
                 logging.info('Successfully connected to PostgreSQL database')
             except Exception as e:
@@ -74,7 +78,20 @@ class Database:
                 logging.error(error_msg)
                 raise DatabaseConnectionError(error_msg) from e
 
-        return cls._instance()
+        return cls._instance
+
+    @classmethod
+    def get_instance(cls) -> Session:
+        """
+        Get a new database session from the shared session factory
+
+        Returns:
+            Session: SQLAlchemy session instance
+
+        Raises:
+            DatabaseConnectionError: If connection cannot be established
+        """
+        return cls.get_sessionmaker()()
 
     @classmethod
     def close(cls) -> None:
@@ -89,7 +106,6 @@ class Database:
                 engine = cls._instance.kw['bind']
                 engine.dispose()
                 cls._instance = None
-                cls.get_instance.cache_clear()
 
                 logging.info('Database connections closed')
             except Exception as e:
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+from typing import Optional
 
 from discord.ext import commands
 
@@ -26,11 +27,22 @@ class DevelopmentCog(BaseCog):
         """Initialize the development cog."""
         super().__init__(bot)
         self.service = DevelopmentService(bot)
+        self.reload_task: Optional[asyncio.Task] = None
 
-    def cog_unload(self):
+    async def cog_load(self) -> None:
+        """Start the reload processing loop when the cog is loaded."""
+        self.reload_task = asyncio.create_task(self.process_reload_loop())
+
+    async def cog_unload(self) -> None:
         """Clean up when the cog is unloaded."""
         self.service.stop_file_watcher()
 
+        # When this cog reloads itself the loop is the task doing the reload,
+        # so it is left to finish and exits on its next check instead
+        task, self.reload_task = self.reload_task, None
+        if task and task is not asyncio.current_task():
+            task.cancel()
+
     @commands.command(name='dev')
     @commands.is_owner()
     async def toggle_dev_mode(self, ctx: commands.Context):
@@ -55,21 +67,14 @@ class DevelopmentCog(BaseCog):
                 await ctx.send('Failed to enable development mode')
 
     async def process_reload_loop(self):
-        """Process the reload queue periodically."""
+        """Process the reload queue whenever the file watcher queues a reload."""
         logger.info('Starting reload processing loop')
         try:
-            while True:
-                await self.service.process_reload_queue()
-                await asyncio.sleep(1)
+            while self.reload_task is asyncio.current_task():
+                await self.service.wait_for_reloads()
         except Exception as e:
             logger.error(f'Error in reload loop: {str(e)}', exc_info=True)
 
-    @commands.Cog.listener()
-    async def on_ready(self):
-        """Start the reload processing loop when the bot is ready."""
-        logger.info('Development cog ready, starting reload loop')
-        self.bot.loop.create_task(self.process_reload_loop())
-
 
 async def setup(bot: KusogakiBot):
     await bot.add_cog(DevelopmentCog(bot))
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from pathlib import Path
 from typing import Set
@@ -16,20 +17,30 @@ class ModuleReloader(FileSystemEventHandler):
 
     This class extends FileSystemEventHandler to watch for file changes in the bot's
     feature directories and manages a queue of modules that need to be reloaded.
+    File events arrive on the watchdog thread, so the queue is only ever mutated
+    on the bot's event loop via call_soon_threadsafe.
 
     Attributes:
         bot (KusogakiBot): The bot instance to manage reloading for
         watch_paths (Set[Path]): Set of paths to watch for changes
         base_path (Path): The base project path for relative path calculations
         reload_queue (Set[str]): Queue of feature names that need to be reloaded
+        reload_requested (asyncio.Event): Set whenever a feature is queued for reload
     """
 
-    def __init__(self, bot: KusogakiBot, watch_paths: Set[Path], base_path: Path):
+    def __init__(
+        self,
+        bot: KusogakiBot,
+        watch_paths: Set[Path],
+        base_path: Path,
+        reload_requested: asyncio.Event,
+    ):
         """Initialize the ModuleReloader."""
         self.bot = bot
         self.watch_paths = watch_paths
         self.base_path = base_path
         self.reload_queue: Set[str] = set()
+        self.reload_requested = reload_requested
 
     def on_modified(self, event: FileSystemEvent):
         """Handle file modification events by queueing affected modules for reload."""
@@ -53,19 +64,25 @@ class ModuleReloader(FileSystemEventHandler):
                     and parts[1] == 'features'
                 ):
                     feature_name = parts[2]
-                    self.reload_queue.add(feature_name)
+                    self.bot.loop.call_soon_threadsafe(self._queue_reload, feature_name)
                     logger.info(f'Queued reload for feature: {feature_name}')
 
         except Exception as e:
             logger.error(f'Error processing file change: {str(e)}', exc_info=True)
 
+    def _queue_reload(self, feature_name: str) -> None:
+        """Queue a feature for reload and wake the reload loop."""
+        self.reload_queue.add(feature_name)
+        self.reload_requested.set()
+
     async def process_reload_queue(self):
         """Process any pending module reloads in the queue."""
         if not self.reload_queue:
             return
 
-        logger.info(f'Processing reload queue: {self.reload_queue}')
-        for feature in list(self.reload_queue):
+        pending, self.reload_queue = self.reload_queue, set()
+        logger.info(f'Processing reload queue: {pending}')
+        for feature in pending:
             try:
                 cog_path = f'kusogaki_bot.features.{feature}.cog'
                 logger.info(f'Attempting to reload: {cog_path}')
@@ -82,8 +99,6 @@ class ModuleReloader(FileSystemEventHandler):
 
             except Exception as e:
                 logger.error(f'Failed to reload {feature}: {str(e)}', exc_info=True)
-            finally:
-                self.reload_queue.remove(feature)
 
 
 class DevelopmentService:
@@ -97,13 +112,17 @@ class DevelopmentService:
         bot (KusogakiBot): The bot instance this service is attached to
         observer (Observer): The file system observer for hot reloading
         reloader (ModuleReloader): The module reloader instance handling file changes
+        reload_requested (asyncio.Event): Set by the reloader when a reload is queued
     """
 
+    RELOAD_SETTLE_TIME = 0.5
+
     def __init__(self, bot: KusogakiBot):
         """Initialize the development service."""
         self.bot = bot
         self.observer = None
         self.reloader = None
+        self.reload_requested = asyncio.Event()
 
     async def start_file_watcher(self) -> bool:
         """
@@ -132,7 +151,9 @@ class DevelopmentService:
             logger.warning('No valid feature directories found to watch!')
             return False
 
-        self.reloader = ModuleReloader(self.bot, watch_paths, base_path)
+        self.reloader = ModuleReloader(
+            self.bot, watch_paths, base_path, self.reload_requested
+        )
         self.observer = Observer()
 
         watch_path = str(base_path)
@@ -163,6 +184,18 @@ class DevelopmentService:
         if self.reloader:
             await self.reloader.process_reload_queue()
 
+    async def wait_for_reloads(self):
+        """
+        Wait until a reload is queued, then process the queue.
+
+        Waits briefly after the first change so that editors writing a file
+        in several steps trigger a single reload of the finished file.
+        """
+        await self.reload_requested.wait()
+        await asyncio.sleep(self.RELOAD_SETTLE_TIME)
+        self.reload_requested.clear()
+        await self.process_reload_queue()
+
     def is_watching(self) -> bool:
         """
         Check if the file watcher is currently active.
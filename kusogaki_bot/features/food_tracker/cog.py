@@ -1,10 +1,13 @@
-from discord import File
+import asyncio
+from typing import Optional
+
+from discord import User
 from discord.ext import commands
 
 from config import AWAIZ_USER_ID
 from kusogaki_bot.core import BaseCog, KusogakiBot
 from kusogaki_bot.features.food_tracker.service import FoodCounterService
-from kusogaki_bot.shared import EmbedType
+from kusogaki_bot.shared import EmbedType, image_service
 
 
 class FoodCounterCog(BaseCog):
@@ -13,6 +16,15 @@ class FoodCounterCog(BaseCog):
     def __init__(self, bot: KusogakiBot):
         super().__init__(bot)
         self.service = FoodCounterService()
+        self._awaiz: Optional[User] = None
+
+    async def _get_awaiz(self) -> Optional[User]:
+        """Get Awaiz's user, only hitting the API on a cache miss"""
+        if self._awaiz is None:
+            self._awaiz = self.bot.get_user(AWAIZ_USER_ID) or await self.bot.fetch_user(
+                AWAIZ_USER_ID
+            )
+        return self._awaiz
 
     async def send_food_mention_embed(self, channel, user, count: int):
         """Create and send food mention embed"""
@@ -26,29 +38,35 @@ class FoodCounterCog(BaseCog):
             EmbedType.NORMAL, 'Awaiz has mentioned food!', description
         )
 
-        file = File('static/caseoh.png', filename='caseoh.png')
-        embed.set_thumbnail(url='attachment://caseoh.png')
+        file = await image_service.get_image_file('static/caseoh.png')
+        if file:
+            embed.set_thumbnail(url=f'attachment://{file.filename}')
 
         await channel.send(embed=embed, file=file)
 
     @commands.command(name='awaiz', aliases=['caseoh'])
     async def food_mention(self, ctx: commands.Context):
         """Increment food mention counter for Awaiz"""
-        awaiz = await self.bot.fetch_user(AWAIZ_USER_ID)
+        awaiz = await self._get_awaiz()
         if not awaiz:
             return
 
-        count = self.service.increment_counter(AWAIZ_USER_ID)
+        count = await asyncio.to_thread(
+            self.service.increment_counter, str(AWAIZ_USER_ID)
+        )
+        if count is None:
+            return
+
         await self.send_food_mention_embed(ctx.channel, awaiz, count)
 
     @commands.command(name='awaizcount', aliases=['drywall'])
     async def food_count(self, ctx: commands.Context):
         """Display food mention count for Awaiz"""
-        awaiz = await self.bot.fetch_user(AWAIZ_USER_ID)
+        awaiz = await self._get_awaiz()
         if not awaiz:
             return
 
-        count = self.service.get_count(AWAIZ_USER_ID)
+        count = await asyncio.to_thread(self.service.get_count, str(AWAIZ_USER_ID))
         description = f"""
 He's eaten everything. {awaiz.mention} has talked about food {count} time(s). I guess he'll start eating drywall soon.
             """
@@ -57,8 +75,9 @@ He's eaten everything. {awaiz.mention} has talked about food {count} time(s). I
             EmbedType.NORMAL, 'Awaiz Food Counter', description
         )
 
-        file = File('static/drywall.png', filename='drywall.png')
-        embed.set_thumbnail(url='attachment://drywall.png')
+        file = await image_service.get_image_file('static/drywall.png')
+        if file:
+            embed.set_thumbnail(url=f'attachment://{file.filename}')
 
         await ctx.send(embed=embed, file=file)
 
@@ -1,12 +1,15 @@
 import logging
-import os
+import time
 from datetime import datetime
+from typing import Dict, Optional, Tuple
 
 from sqlalchemy import Column, DateTime, Integer, String
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.sql import func
 
+from config import BOT_ENV
 from kusogaki_bot.core import Database
 
 Base = declarative_base()
@@ -15,29 +18,47 @@ Base = declarative_base()
 class FoodCounter(Base):
     """Database model for food counter"""
 
-    __tablename__ = (
-        'food_counters_dev'
-        if os.getenv('BOT_ENV', 'development') == 'development'
-        else 'food_counters'
-    )
+    __tablename__ = 'food_counters_dev' if BOT_ENV == 'development' else 'food_counters'
 
     user_id = Column(String, primary_key=True)
     count = Column(Integer, default=0)
     last_updated = Column(DateTime, default=func.now(), onupdate=func.now())
 
-    def increment(self) -> int:
-        """Increment counter and update timestamp"""
-        self.count += 1
-        self.last_updated = datetime.now()
-        return self.count
-
 
 class FoodCounterRepository:
-    """Repository class for food counter persistence"""
+    """Repository class for food counter persistence
+
+    Counters are read far more often than they change, so loaded values are
+    kept in a small in-process cache for CACHE_TTL seconds and refreshed
+    whenever a counter is incremented through this repository.
+    """
+
+    CACHE_TTL = 60.0
 
     def __init__(self):
-        """Initialize database connection"""
-        self.db = Database.get_instance()
+        """Initialize the session factory used for each operation"""
+        self.session_factory = Database.get_instance
+        self._cache: Dict[str, Tuple[int, Optional[datetime], float]] = {}
+
+    def _cache_counter(self, counter: FoodCounter) -> None:
+        """Store a counter's values in the cache"""
+        self._cache[counter.user_id] = (
+            counter.count,
+            counter.last_updated,
+            time.monotonic(),
+        )
+
+    def _get_cached(self, user_id: str) -> Optional[FoodCounter]:
+        """Build a counter from the cache if it holds a fresh entry"""
+        entry = self._cache.get(user_id)
+        if entry is None:
+            return None
+
+        count, last_updated, cached_at = entry
+        if time.monotonic() - cached_at >= self.CACHE_TTL:
+            self._cache.pop(user_id, None)
+            return None
+        return FoodCounter(user_id=user_id, count=count, last_updated=last_updated)
 
     def get_counter(self, user_id: str) -> FoodCounter:
         """
@@ -47,45 +68,66 @@ class FoodCounterRepository:
             user_id (str): Discord user ID
 
         Returns:
-            FoodCounter: Counter object (new if not found)
+            FoodCounter: Counter object (new if not found), detached from the
+                session; counts only change through increment_counter
         """
-        try:
-            counter = self.db.query(FoodCounter).filter_by(user_id=user_id).first()
-            if not counter:
-                counter = FoodCounter(user_id=user_id, count=0)
-            return counter
-        except SQLAlchemyError as e:
-            logging.error(f'Error loading food counter: {str(e)}')
-            return FoodCounter(user_id=user_id, count=0)
-
-    def save_counter(self, counter: FoodCounter) -> None:
+        cached = self._get_cached(user_id)
+        if cached is not None:
+            return cached
+
+        with self.session_factory() as session:
+            try:
+                counter = session.get(FoodCounter, user_id)
+                if not counter:
+                    counter = FoodCounter(user_id=user_id, count=0)
+                self._cache_counter(counter)
+                return counter
+            except SQLAlchemyError as e:
+                logging.error(f'Error loading food counter: {str(e)}')
+                return FoodCounter(user_id=user_id, count=0)
+
+    def increment_counter(self, user_id: str) -> Optional[int]:
         """
-        Save a food counter to the database
+        Atomically increment a user's food counter in the database
 
         Args:
-            counter (FoodCounter): Counter to save
+            user_id (str): Discord user ID
+
+        Returns:
+            Optional[int]: Updated count, or None if the increment was not saved
         """
-        try:
-            if counter.count > 0:
-                if (
-                    not self.db.query(FoodCounter)
-                    .filter_by(user_id=counter.user_id)
-                    .first()
-                ):
-                    self.db.add(counter)
-                self.db.commit()
-            else:
-                self.db.query(FoodCounter).filter_by(user_id=counter.user_id).delete()
-                self.db.commit()
-        except SQLAlchemyError as e:
-            logging.error(f'Error saving food counter: {str(e)}')
-            self.db.rollback()
+        last_updated = datetime.now()
+        stmt = pg_insert(FoodCounter).values(
+            user_id=user_id, count=1, last_updated=last_updated
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[FoodCounter.user_id],
+            set_={
+                'count': FoodCounter.count + 1,
+                'last_updated': stmt.excluded.last_updated,
+            },
+        ).returning(FoodCounter.count)
+
+        with self.session_factory() as session:
+            try:
+                count = session.execute(stmt).scalar_one()
+                session.commit()
+            except SQLAlchemyError as e:
+                logging.error(f'Error incrementing food counter: {str(e)}')
+                session.rollback()
+                self._cache.pop(user_id, None)
+                return None
+
+        self._cache[user_id] = (count, last_updated, time.monotonic())
+        return count
 
     def clear_all(self) -> None:
         """Clear all food counters (for testing)"""
-        try:
-            self.db.query(FoodCounter).delete()
-            self.db.commit()
-        except SQLAlchemyError as e:
-            logging.error(f'Error clearing food counters: {str(e)}')
-            self.db.rollback()
+        with self.session_factory() as session:
+            try:
+                session.query(FoodCounter).delete()
+                session.commit()
+                self._cache.clear()
+            except SQLAlchemyError as e:
+                logging.error(f'Error clearing food counters: {str(e)}')
+                session.rollback()
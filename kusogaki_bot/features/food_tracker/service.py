@@ -1,3 +1,5 @@
+from typing import Optional
+
 from kusogaki_bot.features.food_tracker.data import (
     FoodCounterRepository,
 )
@@ -17,7 +19,7 @@ class FoodCounterService:
             self._food_items = self.mention_repository.get_all_food_items()
         return self._food_items
 
-    def increment_counter(self, user_id: str) -> int:
+    def increment_counter(self, user_id: str) -> Optional[int]:
         """
         Increment food counter for a user and return new count
 
@@ -25,12 +27,9 @@ class FoodCounterService:
             user_id (str): Discord user ID
 
         Returns:
-            int: Updated count
+            Optional[int]: Updated count, or None if it could not be saved
         """
-        counter = self.counter_repository.get_counter(user_id)
-        new_count = counter.increment()
-        self.counter_repository.save_counter(counter)
-        return new_count
+        return self.counter_repository.increment_counter(user_id)
 
     def get_count(self, user_id: str) -> int:
         """
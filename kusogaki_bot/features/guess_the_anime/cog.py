@@ -13,6 +13,23 @@ from kusogaki_bot.shared import EmbedColor, EmbedType
 
 logger = logging.getLogger(__name__)
 
+COUNTDOWN_BAR_WIDTH = 20
+COUNTDOWN_BARS = tuple(
+    f'`{"█" * filled}{"░" * (COUNTDOWN_BAR_WIDTH - filled)}`'
+    for filled in range(COUNTDOWN_BAR_WIDTH + 1)
+)
+TIMER_BAR_WIDTH = 5
+TIMER_BARS = tuple(
+    '█' * filled + '░' * (TIMER_BAR_WIDTH - filled)
+    for filled in range(TIMER_BAR_WIDTH + 1)
+)
+DIFFICULTY_DISPLAY = {
+    'easy': 'Easy 🟢',
+    'medium': 'Medium 🟡',
+    'hard': 'Hard 🔴',
+}
+RANK_MEDALS = {1: '🥇', 2: '🥈', 3: '🥉'}
+
 
 class AnswerView(discord.ui.View):
     """
@@ -87,7 +104,7 @@ class AnswerView(discord.ui.View):
                     await interaction.response.defer()
 
             except Exception as e:
-                logger.error(f'Error in button callback: {e}', exc_info=True)
+                logger.error('Error in button callback: %s', e, exc_info=True)
                 if game_state:
                     try:
                         game_state.answered_players.remove(interaction.user.id)
@@ -156,7 +173,7 @@ class JoinView(discord.ui.View):
                 await self.cog.join_game(interaction=interaction)
 
             except Exception as e:
-                logger.error(f'Error in button callback: {e}', exc_info=True)
+                logger.error('Error in button callback: %s', e, exc_info=True)
 
                 try:
                     await interaction.response.send_message(
@@ -255,22 +272,17 @@ class GTAQuizCog(BaseCog):
 
             view = JoinView(self)
 
-            player_names = (
-                f'<@{player_id}>'
-                for player_id in self.service.get_game(ctx.channel.id).players.keys()
-            )
-
             embed, file = await self.create_embed(
                 EmbedType.NORMAL,
                 '🎮 Guess The Anime Quiz',
                 f'{result.message}\n'
-                f'Player(s): {", ".join(player_names)}\n\n'
+                f'Player(s): {self._player_mentions(ctx.channel.id)}\n\n'
                 'Press the button to join!',
             )
 
             msg = await ctx.send(embed=embed, file=file, view=view)
 
-            logger.info(f'Starting countdown for channel {ctx.channel.id}')
+            logger.info('Starting countdown for channel %s', ctx.channel.id)
             task = asyncio.create_task(self._run_countdown(ctx.channel.id, msg))
             self.active_countdowns[ctx.channel.id] = task
 
@@ -278,7 +290,7 @@ class GTAQuizCog(BaseCog):
                 try:
                     task.result()
                 except Exception as e:
-                    logger.error(f'Countdown task failed: {e}', exc_info=True)
+                    logger.error('Countdown task failed: %s', e, exc_info=True)
                     asyncio.create_task(
                         ctx.send('An error occurred during game startup.')
                     )
@@ -289,7 +301,7 @@ class GTAQuizCog(BaseCog):
             task.add_done_callback(countdown_done)
 
         except Exception as e:
-            logger.error(f'Error starting game: {e}', exc_info=True)
+            logger.error('Error starting game: %s', e, exc_info=True)
             await ctx.send('An error occurred while starting the game.')
             if ctx.channel.id in self.active_countdowns:
                 self.active_countdowns[ctx.channel.id].cancel()
@@ -317,7 +329,7 @@ class GTAQuizCog(BaseCog):
                 await interaction.response.send_message(result.message, ephemeral=True)
 
         except Exception as e:
-            logger.error(f'Error joining game: {e}')
+            logger.error('Error joining game: %s', e)
             await interaction.response.send_message(
                 'An error occurred while joining the game.', ephemeral=True
             )
@@ -336,13 +348,14 @@ class GTAQuizCog(BaseCog):
             Exception: If there's an error stopping the game
         """
         try:
+            await self.service.flush_scores(ctx.channel.id)
             result = self.service.stop_game(ctx.channel.id, ctx.author.id)
             if result.success and ctx.channel.id in self.active_countdowns:
                 self.active_countdowns[ctx.channel.id].cancel()
                 del self.active_countdowns[ctx.channel.id]
             await ctx.send(result.message)
         except Exception as e:
-            logger.error(f'Error stopping game: {e}')
+            logger.error('Error stopping game: %s', e)
             await ctx.send('An error occurred while stopping the game.')
 
     @gta_quiz.command(name='leaderboard')
@@ -360,7 +373,7 @@ class GTAQuizCog(BaseCog):
             Exception: If there's an error fetching or displaying the leaderboard
         """
         try:
-            entries = self.service.get_leaderboard()
+            entries = await asyncio.to_thread(self.service.get_leaderboard)
 
             if not entries:
                 embed, file = await self.create_embed(
@@ -369,7 +382,7 @@ class GTAQuizCog(BaseCog):
             else:
                 description = []
                 for i, entry in enumerate(entries, 1):
-                    medal = {1: '🥇', 2: '🥈', 3: '🥉'}.get(i, '🎮')
+                    medal = RANK_MEDALS.get(i, '🎮')
                     description.append(
                         f'{medal} #{i} - {entry.display_name}: {entry.highest_score} points'
                     )
@@ -383,7 +396,7 @@ class GTAQuizCog(BaseCog):
             await ctx.send(embed=embed, file=file)
 
         except Exception as e:
-            logger.error(f'Error showing leaderboard: {e}')
+            logger.error('Error showing leaderboard: %s', e)
             await ctx.send('An error occurred while fetching the leaderboard.')
 
     @gta_quiz.command(name='score')
@@ -400,7 +413,9 @@ class GTAQuizCog(BaseCog):
             Exception: If there's an error fetching or displaying the player's stats
         """
         try:
-            entry = self.service.get_player_stats(ctx.author.id)
+            entry = await asyncio.to_thread(
+                self.service.get_player_stats, ctx.author.id
+            )
 
             if not entry:
                 description = "You haven't played any games yet!"
@@ -415,14 +430,28 @@ class GTAQuizCog(BaseCog):
             await ctx.send(embed=embed, file=file)
 
         except Exception as e:
-            logger.error(f'Error showing score: {e}')
+            logger.error('Error showing score: %s', e)
             await ctx.send('An error occurred while fetching your score.')
 
+    def _player_mentions(self, channel_id: int) -> str:
+        """
+        Build the comma-separated mention list of players in a channel's game.
+
+        Args:
+            channel_id (int): ID of the channel where the game is running
+
+        Returns:
+            str: Player mentions joined by commas
+        """
+        players = self.service.get_game(channel_id).players
+        return ', '.join([f'<@{player_id}>' for player_id in players])
+
     async def _run_countdown(self, channel_id: int, message: discord.Message) -> None:
         """
         Run the countdown timer before game start with visual progress bar.
 
-        Updates the message every second with the current countdown status.
+        Updates the description of the lobby embed every second with the current
+        countdown status, reusing the embed that was already sent.
 
         Args:
             channel_id (int): ID of the channel where the game is running
@@ -432,70 +461,63 @@ class GTAQuizCog(BaseCog):
             Exception: If there's an error during the countdown process
         """
         try:
+            loop = asyncio.get_running_loop()
+            countdown_deadline = loop.time() + self.service.LOADING_TIME
+            embed = message.embeds[0]
+
             for countdown in range(self.service.LOADING_TIME, -1, -1):
                 if not message:
                     logger.error('Message was deleted during countdown')
                     return
 
-                total_width = 20
-                filled = round((countdown / self.service.LOADING_TIME) * total_width)
-                progress_bar = f'`{"█" * filled}{"░" * (total_width - filled)}`'
-
-                player_names = (
-                    f'<@{player_id}>'
-                    for player_id in self.service.get_game(channel_id).players.keys()
-                )
+                progress_bar = COUNTDOWN_BARS[
+                    round((countdown / self.service.LOADING_TIME) * COUNTDOWN_BAR_WIDTH)
+                ]
 
-                embed, _ = await self.create_embed(
-                    type=EmbedType.NORMAL,
-                    title='🎮 Guess The Anime Quiz',
-                    description=(
-                        f'Game starting in `{countdown}` seconds!\n'
-                        f'{progress_bar}\n\n'
-                        f'Player(s): {", ".join(player_names)}\n\n'
-                        'Press the button to join!'
-                    ),
+                embed.description = (
+                    f'Game starting in `{countdown}` seconds!\n'
+                    f'{progress_bar}\n\n'
+                    f'Player(s): {self._player_mentions(channel_id)}\n\n'
+                    'Press the button to join!'
                 )
 
                 await message.edit(embed=embed)
-                await asyncio.sleep(1)
+                await asyncio.sleep(
+                    max(0, countdown_deadline - countdown + 1 - loop.time())
+                )
 
             game = self.service.get_game(channel_id)
             if not game:
-                logger.error(f'No game found for channel {channel_id} after countdown')
+                logger.error('No game found for channel %s after countdown', channel_id)
                 return
 
             if not game.players:
-                channel = self.bot.get_channel(channel_id)
-                if channel:
-                    await channel.send('Game cancelled - no players joined!')
-                logger.warning(f'No players joined game in channel {channel_id}')
+                await message.channel.send('Game cancelled - no players joined!')
+                logger.warning('No players joined game in channel %s', channel_id)
                 return
 
             logger.info(
-                f'Starting game in channel {channel_id} with {len(game.players)} players'
+                'Starting game in channel %s with %s players',
+                channel_id,
+                len(game.players),
             )
             if not self.service.start_game(channel_id):
-                logger.error(f'Failed to start game in channel {channel_id}')
-                channel = self.bot.get_channel(channel_id)
-                if channel:
-                    await channel.send('Failed to start game - please try again!')
+                logger.error('Failed to start game in channel %s', channel_id)
+                await message.channel.send('Failed to start game - please try again!')
                 return
 
-            await self._run_game(channel_id)
+            await self._run_game(message.channel)
 
         except asyncio.CancelledError:
-            logger.info(f'Countdown cancelled for channel {channel_id}')
+            logger.info('Countdown cancelled for channel %s', channel_id)
         except Exception as e:
-            logger.error(f'Error in countdown: {e}', exc_info=True)
-            channel = self.bot.get_channel(channel_id)
-            if channel:
-                await channel.send('An error occurred while starting the game.')
+            logger.error('Error in countdown: %s', e, exc_info=True)
+            await message.channel.send('An error occurred while starting the game.')
         finally:
             if channel_id in self.active_countdowns:
                 del self.active_countdowns[channel_id]
 
-    async def _run_game(self, channel_id: int) -> None:
+    async def _run_game(self, channel: discord.TextChannel) -> None:
         """
         Main game loop that handles rounds, answers, and game completion.
 
@@ -503,14 +525,13 @@ class GTAQuizCog(BaseCog):
         and determining when the game ends.
 
         Args:
-            channel_id (int): ID of the channel where the game is running
+            channel (discord.TextChannel): The channel where the game is running
 
         Raises:
             Exception: If there's an error during game execution
         """
-        channel = self.bot.get_channel(channel_id)
-        if not channel:
-            return
+        channel_id = channel.id
+        loop = asyncio.get_running_loop()
 
         try:
             while True:
@@ -534,9 +555,9 @@ class GTAQuizCog(BaseCog):
                         f'The correct answer was: **{correct_answer}**'
                     )
 
-                    logger.info(f'Round started - Channel: {channel_id}')
-                    logger.info(f'Correct answer is: {correct_answer}')
-                    logger.info(f'Round difficulty: {current_round_difficulty}')
+                    logger.info('Round started - Channel: %s', channel_id)
+                    logger.info('Correct answer is: %s', correct_answer)
+                    logger.info('Round difficulty: %s', current_round_difficulty)
                 except ValueError as e:
                     await channel.send(f'Error: {e}')
                     break
@@ -552,13 +573,14 @@ class GTAQuizCog(BaseCog):
                 round_msg = await channel.send(
                     embed=base_embed, file=image_file, view=view
                 )
+                round_deadline = loop.time() + self.service.ROUND_TIME
 
                 for i in range(self.service.ROUND_TIME - 1, -1, -1):
                     if self.service.have_all_players_answered(channel_id):
                         logger.info('Round ended early - all players answered')
                         break
 
-                    await asyncio.sleep(1)
+                    await asyncio.sleep(max(0, round_deadline - i - loop.time()))
                     try:
                         updated_embed = await self._create_round_embed(
                             channel_id, options, i, base_embed=round_msg.embeds[0]
@@ -567,9 +589,12 @@ class GTAQuizCog(BaseCog):
                     except discord.NotFound:
                         break
 
+                await self.service.flush_scores(channel_id)
+
+                round_messages = []
                 timed_out_players = self.service.handle_game_timeout(channel_id)
                 if timed_out_players:
-                    timeout_messages = ["⏰ Time's up!"]
+                    round_messages.append("⏰ Time's up!")
                     for player_name, lives in timed_out_players:
                         hearts = '❤️' * lives
                         status = (
@@ -577,23 +602,30 @@ class GTAQuizCog(BaseCog):
                             if lives <= 0
                             else f'has {hearts} remaining'
                         )
-                        timeout_messages.append(
+                        round_messages.append(
                             f"⚠️ {player_name} didn't answer and {status}"
                         )
-                    await channel.send('\n'.join(timeout_messages))
+                    round_messages.append('')
 
-                await channel.send('\n'.join(game.round_feedback))
+                round_messages.extend(game.round_feedback)
 
                 is_game_over, final_scores = self.service.check_game_over(channel_id)
+                results_embed = (
+                    self._create_results_embed(channel, final_scores)
+                    if is_game_over
+                    else None
+                )
+                await channel.send('\n'.join(round_messages), embed=results_embed)
+
                 if is_game_over:
-                    await self._show_game_results(channel, final_scores)
                     self.service.cleanup_game(channel_id)
                     break
 
                 await asyncio.sleep(2)
 
         except Exception as e:
-            logger.error(f'Error in game loop: {e}', exc_info=True)
+            logger.error('Error in game loop: %s', e, exc_info=True)
+            await self.service.flush_scores(channel_id)
             await channel.send('An error occurred during the game.')
             self.service.cleanup_game(channel_id)
 
@@ -664,7 +696,7 @@ class GTAQuizCog(BaseCog):
                     )
 
         except Exception as e:
-            logger.error(f'Error handling answer: {e}', exc_info=True)
+            logger.error('Error handling answer: %s', e, exc_info=True)
             try:
                 await interaction.response.send_message(
                     'An error occurred processing your answer.', ephemeral=True
@@ -677,34 +709,37 @@ class GTAQuizCog(BaseCog):
             if game_state:
                 game_state.processing_answers = False
 
-    async def _show_game_results(
+    def _create_results_embed(
         self, channel: discord.TextChannel, final_scores: Optional[Dict[int, int]]
-    ) -> None:
+    ) -> Optional[discord.Embed]:
         """
-        Display the final results of a completed game.
+        Create the final results embed of a completed game.
 
-        Creates and sends an embed showing the final ranking and scores of all players
-        who participated in the game.
+        Builds an embed showing the final ranking and scores of all players
+        who participated in the game, to be sent alongside the last round's feedback.
 
         Args:
             channel (discord.TextChannel): The channel where the game was played
             final_scores (Optional[Dict[int, int]]): Dictionary mapping player IDs to their final scores
 
+        Returns:
+            Optional[discord.Embed]: The results embed, or None if there is nothing to show
+
         Note:
             Top 3 players are highlighted with medals (gold, silver, bronze)
         """
         if not final_scores:
-            return
+            return None
 
         game = self.service.get_game(channel.id)
         if not game:
-            return
+            return None
 
         sorted_scores = sorted(final_scores.items(), key=lambda x: x[1], reverse=True)
 
         description = []
         for i, (player_id, score) in enumerate(sorted_scores, 1):
-            medal = {1: '🥇', 2: '🥈', 3: '🥉'}.get(i, '🎮')
+            medal = RANK_MEDALS.get(i, '🎮')
             member = channel.guild.get_member(player_id)
             player_name = member.name if member else f'Player {player_id}'
             player = game.players[player_id]
@@ -713,12 +748,11 @@ class GTAQuizCog(BaseCog):
                 score_text += ' 🏆 New Personal Best!'
             description.append(score_text)
 
-        embed = discord.Embed(
+        return discord.Embed(
             title='🎮 Game Over!',
             description='\n'.join(description),
             color=discord.Color.gold(),
         )
-        await channel.send(embed=embed)
 
     async def _create_round_embed(
         self,
@@ -754,12 +788,10 @@ class GTAQuizCog(BaseCog):
             return '\n'.join(status)
 
         def create_timer_footer() -> str:
-            timer_bar = '█' * (time_left // 2) + '░' * (5 - (time_left // 2))
-            diff_display = {
-                'easy': 'Easy 🟢',
-                'medium': 'Medium 🟡',
-                'hard': 'Hard 🔴',
-            }.get(game.current_round_difficulty, 'Normal ⚪')
+            timer_bar = TIMER_BARS[min(time_left // 2, TIMER_BAR_WIDTH)]
+            diff_display = DIFFICULTY_DISPLAY.get(
+                game.current_round_difficulty, 'Normal ⚪'
+            )
             return f'Time: {time_left}s {timer_bar} | Difficulty: {diff_display}'
 
         if base_embed:
@@ -5,7 +5,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Optional, Set, Tuple
 
-from sqlalchemy import Column, Index, Integer, String, desc, func, select
+from sqlalchemy import Column, Index, Integer, String, desc, func, select, update
 from sqlalchemy.orm import declarative_base
 
 from kusogaki_bot.core import DatabaseError
@@ -73,6 +73,7 @@ class GameState:
     correct_streak: int = 0
     answered_players: set[int] = field(default_factory=set)
     timed_out_players: set[int] = field(default_factory=set)
+    scored_players: set[int] = field(default_factory=set)
     round_feedback: list[str] = field(default_factory=list)
     easy_correct: int = 0
     medium_correct: int = 0
@@ -147,14 +148,14 @@ class GTARepository:
                     .limit(batch_size)
                 )
 
-                images = list(session.execute(stmt).scalars().all())
+                images = session.execute(stmt).scalars().all()
                 if not images:
                     return []
 
                 stmt = select(GTAImage.anime_name).where(
                     func.lower(GTAImage.difficulty) == difficulty.lower()
                 )
-                all_names = list(session.execute(stmt).scalars().all())
+                all_names = session.execute(stmt).scalars().all()
 
                 result = []
                 for image in images:
@@ -253,8 +254,7 @@ class GTARepository:
                     .order_by(desc(LeaderboardEntry.highest_score))
                     .limit(limit)
                 )
-                result = session.execute(stmt)
-                return list(result.scalars().all())
+                return session.execute(stmt).scalars().all()
             except Exception as e:
                 logger.error(f'Failed to get leaderboard: {str(e)}')
                 raise DatabaseError(f'Failed to get leaderboard: {str(e)}') from e
@@ -282,57 +282,66 @@ class GTARepository:
                 logger.error(f'Failed to get player entry: {str(e)}')
                 raise DatabaseError(f'Failed to get player entry: {str(e)}') from e
 
-    def update_player_score(
-        self, user_id: int, display_name: str, score: int
-    ) -> Optional[int]:
+    def update_player_scores(
+        self, scores: Dict[int, Tuple[str, int]]
+    ) -> Dict[int, int]:
         """
-        Update a player's score.
+        Update several players' scores in a single transaction.
 
         Args:
-            user_id (int): The ID of the player to update.
-            display_name (str): The display name of the player.
-            score (int): The new score to record.
+            scores (Dict[int, Tuple[str, int]]): Mapping of player IDs to their
+                display name and current score.
 
         Returns:
-            Optional[int]: The player's new highest score if updated, None otherwise.
+            Dict[int, int]: Mapping of player IDs to their new highest score, for
+                players whose score was a new high score.
 
         Raises:
-            DatabaseError: If there's an error updating the player's score.
+            DatabaseError: If there's an error updating the players' scores.
         """
+        if not scores:
+            return {}
+
         with self.session_factory() as session:
             try:
-                entry = session.execute(
-                    select(LeaderboardEntry).where(
-                        LeaderboardEntry.user == str(user_id)
-                    )
-                ).scalar_one_or_none()
-
-                is_new_high_score = False
-
-                if entry:
-                    if score > entry.highest_score:
-                        entry.highest_score = score
-                        entry.display_name = display_name
-                        is_new_high_score = True
-                else:
-                    entry = LeaderboardEntry(
-                        user=str(user_id),
-                        display_name=display_name,
-                        highest_score=score,
-                        place=0,
-                    )
-                    session.add(entry)
-                    is_new_high_score = True
-
-                if is_new_high_score:
+                entries = {
+                    entry.user: entry
+                    for entry in session.execute(
+                        select(LeaderboardEntry).where(
+                            LeaderboardEntry.user.in_(
+                                [str(user_id) for user_id in scores]
+                            )
+                        )
+                    ).scalars()
+                }
+
+                new_high_scores = {}
+                for user_id, (display_name, score) in scores.items():
+                    entry = entries.get(str(user_id))
+                    if entry:
+                        if score > entry.highest_score:
+                            entry.highest_score = score
+                            entry.display_name = display_name
+                            new_high_scores[user_id] = score
+                    else:
+                        session.add(
+                            LeaderboardEntry(
+                                user=str(user_id),
+                                display_name=display_name,
+                                highest_score=score,
+                                place=0,
+                            )
+                        )
+                        new_high_scores[user_id] = score
+
+                if new_high_scores:
                     session.commit()
                     self._update_rankings(session)
-                    return entry.highest_score
-                return None
+                return new_high_scores
             except Exception as e:
                 session.rollback()
-                logger.error(f'Failed to update player score: {str(e)}')
-                raise DatabaseError(f'Failed to update player score: {str(e)}') from e
+                logger.error(f'Failed to update player scores: {str(e)}')
+                raise DatabaseError(f'Failed to update player scores: {str(e)}') from e
 
     def _update_rankings(self, session) -> None:
         """
@@ -345,18 +354,22 @@ class GTARepository:
             DatabaseError: If there's an error updating the rankings.
         """
         try:
-            entries = (
-                session.execute(
-                    select(LeaderboardEntry).order_by(
-                        desc(LeaderboardEntry.highest_score)
-                    )
+            ranked = select(
+                LeaderboardEntry.id,
+                func.row_number()
+                .over(order_by=desc(LeaderboardEntry.highest_score))
+                .label('new_place'),
+            ).subquery()
+
+            session.execute(
+                update(LeaderboardEntry)
+                .where(
+                    LeaderboardEntry.id == ranked.c.id,
+                    LeaderboardEntry.place != ranked.c.new_place,
                 )
-                .scalars()
-                .all()
+                .values(place=ranked.c.new_place)
+                .execution_options(synchronize_session=False)
             )
-
-            for i, e in enumerate(entries, 1):
-                e.place = i
             session.commit()
         except Exception as e:
             session.rollback()
@@ -7,6 +7,7 @@ from typing import Dict, List, Optional, Tuple
 
 from discord import File
 
+from kusogaki_bot.core import DatabaseError
 from kusogaki_bot.features.guess_the_anime.data import (
     GameDifficulty,
     GameState,
@@ -244,12 +245,11 @@ class GTAGameService:
         if not game:
             return True, None
 
-        active_players = [p for p in game.players.values() if p.lives > 0]
-        if not active_players:
-            final_scores = {p.id: p.score for p in game.players.values()}
-            return True, final_scores
+        if any(p.lives > 0 for p in game.players.values()):
+            return False, None
 
-        return False, None
+        final_scores = {p.id: p.score for p in game.players.values()}
+        return True, final_scores
 
     def get_current_difficulty(self, game: GameState) -> str:
         """
@@ -405,9 +405,7 @@ class GTAGameService:
                         f'Got HARD correct. Totals - Easy: {game.easy_correct}, Medium: {game.medium_correct}, Hard: {game.hard_correct}'
                     )
 
-                player.pending_high_score = self.repository.update_player_score(
-                    player_id, player.name, player.score
-                )
+                game.scored_players.add(player_id)
                 return True, False, None
             else:
                 if player_id not in game.timed_out_players:
@@ -421,6 +419,37 @@ class GTAGameService:
                 game.answered_players.remove(player_id)
             raise
 
+    async def flush_scores(self, channel_id: int) -> None:
+        """
+        Persist the scores of players who scored since the last flush.
+
+        Scores are written once per round rather than on every correct answer,
+        and new high scores are recorded on the players for the results display.
+
+        Args:
+            channel_id: Discord channel ID of the game.
+        """
+        game = self.games.get(channel_id)
+        if not game or not game.scored_players:
+            return
+
+        scores = {
+            player_id: (game.players[player_id].name, game.players[player_id].score)
+            for player_id in game.scored_players
+        }
+        game.scored_players.clear()
+
+        try:
+            new_high_scores = await asyncio.to_thread(
+                self.repository.update_player_scores, scores
+            )
+        except DatabaseError:
+            logger.warning(f'Scores for channel {channel_id} were not saved')
+            return
+
+        for player_id, high_score in new_high_scores.items():
+            game.players[player_id].pending_high_score = high_score
+
     def handle_game_timeout(self, channel_id: int) -> List[Tuple[str, int]]:
         """
         Handle timeout for a game channel with race condition protection.
@@ -463,8 +492,10 @@ class GTAGameService:
         if not game:
             return False
 
-        active_players = set(p.id for p in game.players.values() if p.lives > 0)
-        return active_players.issubset(game.answered_players)
+        answered_players = game.answered_players
+        return all(
+            p.id in answered_players for p in game.players.values() if p.lives > 0
+        )
 
     def get_leaderboard(self) -> List[LeaderboardEntry]:
         """
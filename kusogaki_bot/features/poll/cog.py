@@ -1,5 +1,7 @@
 import asyncio
 import logging
+import time
+from typing import Optional
 
 from discord.ext import commands
 
@@ -7,6 +9,8 @@ from kusogaki_bot.core import BaseCog, KusogakiBot
 from kusogaki_bot.features.poll.service import PollError, PollService
 from kusogaki_bot.shared import check_permission
 
+logger = logging.getLogger(__name__)
+
 
 class PollCog(BaseCog):
     """
@@ -16,6 +20,17 @@ class PollCog(BaseCog):
     def __init__(self, bot: KusogakiBot):
         super().__init__(bot)
         self.poll_service = PollService()
+        self.expiry_rescheduled = asyncio.Event()
+        self.expiry_task: Optional[asyncio.Task] = None
+
+    async def cog_load(self) -> None:
+        """Start the poll expiry worker when the cog is loaded."""
+        self.expiry_task = asyncio.create_task(self._run_poll_expiry())
+
+    async def cog_unload(self) -> None:
+        """Stop the poll expiry worker when the cog is unloaded."""
+        if self.expiry_task:
+            self.expiry_task.cancel()
 
     @commands.command(name='poll', description='Create a new poll')
     async def create_poll(
@@ -42,10 +57,8 @@ class PollCog(BaseCog):
             self.poll_service.validate_options(options)
             poll = self.poll_service.create_poll(question, duration, multiple, options)
             poll_message = await ctx.send(poll=poll)
-            self.poll_service.add_poll(question, poll, poll_message)
-            self.bot.loop.create_task(
-                self._remove_poll_after_expiry(question, duration)
-            )
+            self.poll_service.add_poll(question, poll, poll_message, duration)
+            self.expiry_rescheduled.set()
         except PollError as e:
             await ctx.send(str(e))
 
@@ -64,7 +77,7 @@ class PollCog(BaseCog):
         except PollError as e:
             await ctx.send(str(e))
         except Exception as e:
-            logging.error(f'Error ending poll: {str(e)}', exc_info=True)
+            logger.error('Error ending poll: %s', e, exc_info=True)
             await ctx.send('An error occurred while ending the poll.')
 
     @commands.command(name='listpolls', description='List all active polls')
@@ -74,10 +87,26 @@ class PollCog(BaseCog):
         polls_list = self.poll_service.list_active_polls()
         await ctx.send(polls_list)
 
-    async def _remove_poll_after_expiry(self, question: str, duration: int):
-        """Remove poll after it expires."""
-        await asyncio.sleep(duration * 3600)
-        self.poll_service.remove_poll(question)
+    async def _run_poll_expiry(self) -> None:
+        """
+        Remove polls as their duration elapses.
+
+        Sleeps until the earliest scheduled expiry, or until a new poll is
+        scheduled, instead of waking up on a fixed interval.
+        """
+        while True:
+            for question in self.poll_service.remove_expired_polls():
+                logger.info('Poll expired: %s', question)
+
+            next_expiry = self.poll_service.next_expiry()
+            timeout = (
+                None if next_expiry is None else max(0, next_expiry - time.monotonic())
+            )
+            try:
+                await asyncio.wait_for(self.expiry_rescheduled.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            self.expiry_rescheduled.clear()
 
 
 async def setup(bot: KusogakiBot):
@@ -1,5 +1,7 @@
+import heapq
+import time
 from datetime import timedelta
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import discord
 
@@ -15,6 +17,8 @@ class PollService:
 
     def __init__(self):
         self.active_polls: Dict[str, Tuple[discord.Poll, discord.Message]] = {}
+        self.expires_at: Dict[str, float] = {}
+        self._expiry_heap: List[Tuple[float, str]] = []
 
     def validate_options(self, options: Tuple[str, ...]) -> None:
         """
@@ -73,18 +77,64 @@ class PollService:
         return self.active_polls[question]
 
     def add_poll(
-        self, question: str, poll: discord.Poll, message: discord.Message
+        self,
+        question: str,
+        poll: discord.Poll,
+        message: discord.Message,
+        duration: int,
     ) -> None:
-        """Add a poll to active polls."""
+        """
+        Add a poll to active polls and schedule its expiry.
+
+        Args:
+            question: Poll question
+            poll: Poll object
+            message: Message the poll was sent in
+            duration: Duration in hours
+        """
+        expires_at = time.monotonic() + duration * 3600
         self.active_polls[question] = (poll, message)
+        self.expires_at[question] = expires_at
+        heapq.heappush(self._expiry_heap, (expires_at, question))
 
     def remove_poll(self, question: str) -> None:
         """Remove a poll from active polls."""
 
         if question not in self.active_polls:
             raise PollError('No active poll found with that question.')
+        self.expires_at.pop(question, None)
         return self.active_polls.pop(question)
 
+    def next_expiry(self) -> Optional[float]:
+        """
+        Get the monotonic time at which the next scheduled expiry is due.
+
+        Returns:
+            Optional[float]: The earliest expiry time, or None if nothing is scheduled
+        """
+        return self._expiry_heap[0][0] if self._expiry_heap else None
+
+    def remove_expired_polls(self) -> List[str]:
+        """
+        Remove every poll whose duration has elapsed.
+
+        Heap entries left behind by polls that were ended early or replaced
+        are skipped when they reach the top of the heap.
+
+        Returns:
+            List[str]: Questions of the polls that were removed
+        """
+        now = time.monotonic()
+        expired = []
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            expires_at, question = heapq.heappop(self._expiry_heap)
+            if self.expires_at.get(question) != expires_at:
+                continue
+            del self.expires_at[question]
+            self.active_polls.pop(question, None)
+            expired.append(question)
+        return expired
+
     def list_active_polls(self) -> str:
         """Get formatted string of active polls."""
         if not self.active_polls:
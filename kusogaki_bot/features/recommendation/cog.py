@@ -14,6 +14,10 @@ class RecommendationCog(BaseCog):
         super().__init__(bot)
         self.recommendation_service = RecommendationService()
 
+    async def cog_unload(self) -> None:
+        """Close the recommendation service's HTTP client"""
+        await self.recommendation_service.cleanup()
+
     @commands.command(
         name='recommend',
         description='Have the bot recommend a manga/anime.',
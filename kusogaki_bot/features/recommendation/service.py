@@ -1,11 +1,11 @@
 import logging
-from asyncio import Semaphore, gather, sleep
-from datetime import datetime
+import time
+from asyncio import Semaphore, gather, sleep, to_thread
 from random import uniform
 from typing import Dict, List, Optional, Tuple
 
 from discord import Embed, File
-from httpx import AsyncClient, ReadTimeout, RequestError
+from httpx import AsyncClient, Limits, ReadTimeout, RequestError
 
 from kusogaki_bot.features.recommendation.data import MediaRec, RecScoringModel
 from kusogaki_bot.shared.utils.embeds import EmbedType, get_embed
@@ -19,6 +19,47 @@ class RecommendationService:
     def __init__(self):
         self.known_manga_recs = {}
         self.known_anime_recs = {}
+        self.client: Optional[AsyncClient] = None
+
+    def get_client(self) -> AsyncClient:
+        """
+        Get or create the HTTP client shared by all anilist requests
+
+        Keeping one client lets requests reuse pooled keep-alive connections
+        instead of opening a new TLS connection to anilist for every query.
+
+        Returns:
+            AsyncClient: An open HTTP client
+        """
+        if self.client is None or self.client.is_closed:
+            self.client = AsyncClient(
+                limits=Limits(max_connections=32, keepalive_expiry=60)
+            )
+        return self.client
+
+    async def cleanup(self) -> None:
+        """Close the shared HTTP client"""
+        if self.client and not self.client.is_closed:
+            await self.client.aclose()
+
+    @staticmethod
+    def _retry_delay(retry_after: Optional[str], attempt: int) -> float:
+        """
+        Seconds to wait before retrying a failed anilist request
+
+        Args:
+            retry_after (Optional[str]): Retry-After header of a rate limited response
+            attempt (int): Zero-based number of the attempt that failed
+
+        Returns:
+            float: Anilist's requested delay when rate limited, otherwise
+                exponential backoff, plus up to a second of jitter
+        """
+        try:
+            delay = float(retry_after)
+        except (TypeError, ValueError):
+            delay = 2**attempt
+        return delay + uniform(0, 1)
 
     async def query_user_statistics(
         self, anilist_username: str, media_type: str
@@ -60,15 +101,14 @@ class RecommendationService:
         """
         variables = {'name': anilist_username}
         logger.info(f'Querying user statistics for {anilist_username} ({media_type})')
-        async with AsyncClient() as client:
-            try:
-                response = await client.post(
-                    url='https://graphql.anilist.co',
-                    json={'query': query, 'variables': variables},
-                )
-            except ReadTimeout as e:
-                logger.error(f'Request timed out fetching {anilist_username}: {e}')
-                return None
+        try:
+            response = await self.get_client().post(
+                url='https://graphql.anilist.co',
+                json={'query': query, 'variables': variables},
+            )
+        except ReadTimeout as e:
+            logger.error(f'Request timed out fetching {anilist_username}: {e}')
+            return None
         if response.status_code == 200:
             user_data = response.json()['data']['User']
 
@@ -154,6 +194,7 @@ class RecommendationService:
                     'chunk': chunk,
                 }
                 logger.debug(f'Querying chunk {chunk} for {anilist_username}')
+                retry_after = None
                 async with max_concurrent:
                     try:
                         data = await session.post(
@@ -163,6 +204,8 @@ class RecommendationService:
                         )
                         if data.status_code == 200:
                             return data
+                        if data.status_code == 429:
+                            retry_after = data.headers.get('Retry-After')
                     except ReadTimeout:
                         logger.warning(
                             f'List data chunk {chunk} for {anilist_username} timed out'
@@ -171,7 +214,8 @@ class RecommendationService:
                     f'Attempt {attempt + 1}/{max_attempts} failed for chunk {chunk}'
                 )
 
-                await sleep((2**attempt) + uniform(0, 1))
+                if attempt + 1 < max_attempts:
+                    await sleep(self._retry_delay(retry_after, attempt))
             logger.warning(
                 f'Failed to get list data chunk {chunk} after {max_attempts}'
             )
@@ -180,11 +224,11 @@ class RecommendationService:
         tasks: list = []
 
         logger.info(f'Querying user list data for {anilist_username} ({media_type})')
-        async with AsyncClient() as client:
-            for i in range(1, watched_count // chunk_size + 2):
-                tasks.append(query_list_recommendations(client, i))
+        client = self.get_client()
+        for i in range(1, watched_count // chunk_size + 2):
+            tasks.append(query_list_recommendations(client, i))
 
-            raw_list_data = await gather(*tasks)
+        raw_list_data = await gather(*tasks)
 
         full_rec_list: list = []
         for data_chunk in raw_list_data:
@@ -408,9 +452,7 @@ class RecommendationService:
         )
 
         try:
-            time_delta = (
-                datetime.now() - known_recs[anilist_username]['date']
-            ).total_seconds()
+            time_delta = time.monotonic() - known_recs[anilist_username]['date']
         except KeyError:
             time_delta = 0
 
@@ -420,13 +462,14 @@ class RecommendationService:
                 anilist_username=anilist_username,
                 media_type=media_type,
             )
-            recommendation_scores = self.calculate_rec_scores(
+            recommendation_scores = await to_thread(
+                self.calculate_rec_scores,
                 list_data=list_data,
                 user_stats=user_stats,
                 user_favorites=user_favorites,
             )
             known_recs[anilist_username] = {
-                'date': datetime.now(),
+                'date': time.monotonic(),
                 'recs': recommendation_scores,
             }
             logger.info(
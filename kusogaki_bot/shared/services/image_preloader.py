@@ -39,7 +39,7 @@ class ImagePreloader:
     Attributes:
         provider (ImageProvider): The image provider implementation
         preload_count (int): Number of images to preload per category
-        preloaded_images (Dict[str, List[dict]]): Cache of preloaded images per category
+        preloaded_images (Dict[str, List[Tuple[Any, List[str]]]]): Cache of preloaded (image, options) pairs per category
         used_images (Dict[str, Set[int]]): Tracking of used image IDs per category
         _preload_lock (asyncio.Lock): Lock for synchronizing preload operations
         _preload_tasks (Dict[str, asyncio.Task]): Active preload tasks per category
@@ -56,7 +56,9 @@ class ImagePreloader:
         """
         self.provider = provider
         self.preload_count = preload_count
-        self.preloaded_images: Dict[str, List[dict]] = defaultdict(list)
+        self.preloaded_images: Dict[str, List[Tuple[Any, List[str]]]] = defaultdict(
+            list
+        )
         self.used_images: Dict[str, Set[int]] = defaultdict(set)
         self._preload_lock = asyncio.Lock()
         self._preload_tasks: Dict[str, asyncio.Task] = {}
@@ -82,22 +84,28 @@ class ImagePreloader:
 
         Note:
             This method handles both batch and individual image loading depending on
-            provider capabilities. It transforms URLs and updates the internal cache
-            while maintaining the preload count limit.
+            provider capabilities. Provider calls are blocking database queries, so
+            they run in a worker thread against a snapshot of the used image IDs.
+            It transforms URLs and updates the internal cache while maintaining the
+            preload count limit.
         """
         try:
             if len(self.preloaded_images[category]) >= self.preload_count:
                 return
 
+            used_ids = frozenset(self.used_images[category])
             if hasattr(self.provider, 'get_images_batch'):
-                images_data = self.provider.get_images_batch(
-                    category, self.used_images[category], self._batch_size
+                images_data = await asyncio.to_thread(
+                    self.provider.get_images_batch,
+                    category,
+                    used_ids,
+                    self._batch_size,
                 )
             else:
                 images_data = []
                 while len(images_data) < self._batch_size:
-                    image_data = self.provider.get_random_unused_image(
-                        category, self.used_images[category]
+                    image_data = await asyncio.to_thread(
+                        self.provider.get_random_unused_image, category, used_ids
                     )
                     if not image_data:
                         break
@@ -116,9 +124,7 @@ class ImagePreloader:
                     break
 
                 self.used_images[category].add(image.id)
-                self.preloaded_images[category].append(
-                    {'image': image, 'options': options}
-                )
+                self.preloaded_images[category].append((image, options))
 
         except Exception as e:
             logger.error(f'Error preloading images for {category}: {e}')
@@ -146,7 +152,7 @@ class ImagePreloader:
             if not self.preloaded_images[category]:
                 return None
 
-        image_data = self.preloaded_images[category].pop(0)
+        image, options = self.preloaded_images[category].pop(0)
 
         if (
             len(self.preloaded_images[category]) < self.preload_count / 2
@@ -156,7 +162,7 @@ class ImagePreloader:
                 self._preload_batch(category)
             )
 
-        return image_data['image'], image_data['options']
+        return image, options
 
     async def cleanup_category(self, category: str):
         """
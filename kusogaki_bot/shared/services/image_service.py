@@ -1,7 +1,7 @@
 import asyncio
 import io
 import logging
-from datetime import datetime, timedelta
+import time
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
@@ -20,9 +20,9 @@ class ImageCache:
     Uses an async lock for thread-safe operations.
 
     Attributes:
-        _cache (Dict[str, Tuple[bytes, datetime]]): Internal cache storage mapping keys to tuples of (data, timestamp)
+        _cache (Dict[str, Tuple[bytes, float]]): Internal cache storage mapping keys to tuples of (data, monotonic timestamp)
         _max_size (int): Maximum number of items to store in cache
-        _ttl (timedelta): Time-to-live duration for cached items
+        _ttl (float): Time-to-live duration for cached items, in seconds
         _lock (asyncio.Lock): Async lock for thread-safe operations
     """
 
@@ -33,9 +33,9 @@ class ImageCache:
             max_size (int, optional): Maximum number of items to store. Defaults to 1000.
             ttl_seconds (int, optional): Time-to-live in seconds. Defaults to 3600.
         """
-        self._cache: Dict[str, Tuple[bytes, datetime]] = {}
+        self._cache: Dict[str, Tuple[bytes, float]] = {}
         self._max_size = max_size
-        self._ttl = timedelta(seconds=ttl_seconds)
+        self._ttl = float(ttl_seconds)
         self._lock = asyncio.Lock()
 
     async def get(self, key: str) -> Optional[bytes]:
@@ -50,7 +50,7 @@ class ImageCache:
         async with self._lock:
             if key in self._cache:
                 data, timestamp = self._cache[key]
-                if datetime.now() - timestamp < self._ttl:
+                if time.monotonic() - timestamp < self._ttl:
                     return data
                 del self._cache[key]
         return None
@@ -69,7 +69,7 @@ class ImageCache:
                 sorted_items = sorted(self._cache.items(), key=lambda x: x[1][1])
                 self._cache = dict(sorted_items[len(sorted_items) // 2 :])
 
-            self._cache[key] = (data, datetime.now())
+            self._cache[key] = (data, time.monotonic())
 
 
 class ImageService:
@@ -81,6 +81,7 @@ class ImageService:
     Attributes:
         session (Optional[aiohttp.ClientSession]): HTTP client session for making requests
         cache (ImageCache): Instance of ImageCache for storing retrieved images
+        _local_images (Dict[str, bytes]): Contents of local image files, read once per path
         _session_lock (asyncio.Lock): Lock for thread-safe session management
     """
 
@@ -88,6 +89,7 @@ class ImageService:
         """Initialize the image service with a cache and session lock."""
         self.session: Optional[aiohttp.ClientSession] = None
         self.cache = ImageCache(max_size=1000, ttl_seconds=3600)
+        self._local_images: Dict[str, bytes] = {}
         self._session_lock = asyncio.Lock()
 
     async def get_session(self) -> aiohttp.ClientSession:
@@ -263,6 +265,27 @@ class ImageService:
         if tasks:
             await asyncio.gather(*tasks, return_exceptions=True)
 
+    async def get_local_image_data(self, path: str) -> Optional[bytes]:
+        """Read a local image file, keeping its contents in memory.
+
+        Local images are static bot assets, so each file is read from disk once
+        in a worker thread and served from memory afterwards.
+
+        Args:
+            path (str): Path of the image file
+
+        Returns:
+            Optional[bytes]: The image data if the file exists, None otherwise
+        """
+        data = self._local_images.get(path)
+        if data is None:
+            try:
+                data = await asyncio.to_thread(Path(path).read_bytes)
+            except OSError:
+                return None
+            self._local_images[path] = data
+        return data
+
     async def get_image_file(self, url: str) -> Optional[File]:
         """Convert image data to Discord File object.
 
@@ -277,8 +300,10 @@ class ImageService:
         """
         try:
             if not url.startswith(('http://', 'https://')):
-                path = Path(url)
-                return File(path) if path.exists() else None
+                data = await self.get_local_image_data(url)
+                if data is None:
+                    return None
+                return File(io.BytesIO(data), filename=Path(url).name)
 
             data = await self.get_image_data(url)
             if data:
@@ -1,8 +1,8 @@
-from datetime import datetime
 from enum import Enum
 from typing import Optional, Tuple
 
 from discord import Embed, File
+from discord.utils import utcnow
 
 
 class EmbedColor(int, Enum):
@@ -44,7 +44,7 @@ async def get_embed(
         title=title,
         description=description,
         color=type.value.value,
-        timestamp=datetime.now(),
+        timestamp=utcnow(),
     )
 
     if thumbnail_path:
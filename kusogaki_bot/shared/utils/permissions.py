@@ -1,8 +1,7 @@
-from typing import Any, Callable
+from typing import Any, Callable, Optional, Set
 
 from discord.ext import commands
 from discord.ext.commands import CheckFailure, Context
-from discord.utils import get
 
 from config import STAFF_ROLE_ID
 
@@ -13,6 +12,31 @@ class MissingRequiredRole(CheckFailure):
     pass
 
 
+_team_member_ids: Optional[Set[int]] = None
+
+
+async def _get_team_member_ids(bot: commands.Bot) -> Set[int]:
+    """
+    Get the IDs of the bot's Developer Portal team members.
+
+    The application info is fetched once and reused, since team membership
+    only changes through the Developer Portal.
+
+    Args:
+        bot: The bot instance
+
+    Returns:
+        Set[int]: IDs of the team members, empty if the bot has no team
+    """
+    global _team_member_ids
+    if _team_member_ids is None:
+        app_info = await bot.application_info()
+        _team_member_ids = (
+            {m.id for m in app_info.team.members} if app_info.team else set()
+        )
+    return _team_member_ids
+
+
 def has_required_permission() -> Callable[[Context], Any]:
     """Check if the user is either in a Discord Developer Portal team or has the staff role."""
 
@@ -20,14 +44,10 @@ def has_required_permission() -> Callable[[Context], Any]:
         member = ctx.author
         bot = ctx.bot
 
-        app_info = await bot.application_info()
-        if app_info.team:
-            team_member_ids = [m.id for m in app_info.team.members]
-            if member.id in team_member_ids:
-                return True
+        if member.id in await _get_team_member_ids(bot):
+            return True
 
-        staff_role = get(ctx.guild.roles, id=STAFF_ROLE_ID)
-        if staff_role and staff_role in member.roles:
+        if member.get_role(STAFF_ROLE_ID):
             return True
 
         raise MissingRequiredRole(
@@ -1,20 +1,57 @@
+import asyncio
 import logging
 import sys
 from typing import NoReturn
 
+import discord
+
 from config import TOKEN
 from kusogaki_bot.core.bot import KusogakiBot
 
 logger = logging.getLogger(__name__)
 
 
+def configure_logging() -> None:
+    """
+    Configure a single root log handler for the bot and discord.py
+
+    The discord.py HTTP and gateway loggers are noisy at INFO, so they are
+    limited to warnings
+    """
+    discord.utils.setup_logging(level=logging.INFO, root=True)
+    logging.getLogger('discord.http').setLevel(logging.WARNING)
+    logging.getLogger('discord.gateway').setLevel(logging.WARNING)
+
+
+def install_event_loop_policy() -> None:
+    """
+    Use uvloop as the asyncio event loop when it is available
+
+    uvloop is POSIX-only, so Windows and environments without it fall back
+    to the default asyncio event loop
+    """
+    if sys.platform == 'win32':
+        return
+
+    try:
+        import uvloop
+    except ImportError:
+        logger.info('uvloop is not installed, using the default event loop')
+        return
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def main() -> NoReturn:
     """
     Initialize and run the Discord bot
     """
+    configure_logging()
+    install_event_loop_policy()
+
     try:
         bot = KusogakiBot()
-        bot.run(TOKEN)
+        bot.run(TOKEN, log_handler=None)
     except Exception as e:
         logger.critical(f'Failed to start bot: {str(e)}')
         sys.exit(1)